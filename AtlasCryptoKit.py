@@ -17,33 +17,69 @@ CLI-інструмент для локальної роботи з Ethereum-су
 import os
 import json
 import argparse
+import asyncio
+import atexit
+import functools
 import getpass
+import hashlib
+import hmac
 import secrets
 from decimal import Decimal
-from typing import Tuple
+from typing import List, Tuple
 
+import aiohttp
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from mnemonic import Mnemonic
 from eth_account import Account
+from eth_account.hdaccount.deterministic import HardNode, SoftNode, derive_child_key
 from eth_account.messages import encode_defunct
-from web3 import Web3
+from eth_abi.exceptions import DecodingError
+from web3 import AsyncHTTPProvider, HTTPProvider, Web3
+from web3.eth import AsyncEth
+from web3.exceptions import BadFunctionCallOutput
 from web3.middleware import geth_poa_middleware
 
 # Налаштування: змінюй на свій RPC лише коли впевнений
 DEFAULT_RPC = "https://mainnet.infura.io/v3/YOUR_INFURA_KEY"  # замінити або передати через --rpc
 
+# розбір BIP-39 словника з диска — робимо один раз на процес
+_MNEMO = Mnemonic("english")
+
+# decimals/symbol токенів незмінні — кешуємо їх локально між запусками
+_TOKEN_META_PATH = os.path.expanduser("~/.atlas_crypto/token_meta.json")
+
 # --- УТИЛІТИ ---
 
+_WEI = Decimal(10) ** 18
+_GWEI = Decimal(10) ** 9
+
 
 def safe_print(msg: str):
     print(msg)
 
 
+@functools.lru_cache(maxsize=64)
+def _pow10(decimals: int) -> Decimal:
+    return Decimal(10) ** decimals
+
+
 def wei_to_eth(wei: int) -> Decimal:
-    return Decimal(wei) / Decimal(10**18)
+    return Decimal(wei) / _WEI
 
 
 def eth_to_wei(amount_eth: Decimal) -> int:
-    return int(amount_eth * Decimal(10**18'))
+    return int(amount_eth * _WEI)
+
+
+def gwei_to_wei(amount_gwei: Decimal) -> int:
+    return int(amount_gwei * _GWEI)
+
+
+def format_units(raw: int, decimals: int) -> Decimal:
+    """Переводить сире ціле значення токена в Decimal — лише для показу."""
+    return Decimal(raw) / _pow10(decimals)
 
 
 # --- ГАМАНЕЦЬ / HD ---
@@ -51,35 +87,93 @@ def eth_to_wei(amount_eth: Decimal) -> int:
 
 def generate_mnemonic(strength: int = 128) -> str:
     """Генерує BIP-39 мнемоніку (12/24 слів залежно від strength)."""
-    mnemo = Mnemonic("english")
-    return mnemo.generate(strength=strength)
+    return _MNEMO.generate(strength=strength)
 
 
 def mnemonic_to_seed(mnemonic: str, passphrase: str = "") -> bytes:
-    mnemo = Mnemonic("english")
-    return mnemo.to_seed(mnemonic, passphrase=passphrase)
+    return _MNEMO.to_seed(mnemonic, passphrase=passphrase)
+
+
+def derive_accounts(mnemonic: str, count: int, passphrase: str = "", start: int = 0) -> List[Tuple[str, str]]:
+    """
+    Повертає [(address, private_key_hex), ...] для m/44'/60'/0'/0/start..start+count-1.
+    Seed (PBKDF2, 2048 ітерацій) і вузол m/44'/60'/0'/0 рахуються один раз,
+    далі кожна адреса — це один крок BIP-32 (HMAC-SHA512).
+    """
+    if not _MNEMO.check(mnemonic):
+        raise ValueError("Невалідна BIP-39 мнемоніка")
+    seed = mnemonic_to_seed(mnemonic, passphrase=passphrase)
+    master = hmac.new(b"Bitcoin seed", seed, hashlib.sha512).digest()
+    key, chain_code = master[:32], master[32:]
+    for node in (HardNode(44), HardNode(60), HardNode(0), SoftNode(0)):
+        key, chain_code = derive_child_key(key, chain_code, node)
+
+    accounts = []
+    for i in range(start, start + count):
+        child_key, _ = derive_child_key(key, chain_code, SoftNode(i))
+        acct = Account.from_key(child_key)
+        accounts.append((acct.address, acct.key.hex()))
+    return accounts
 
 
 def derive_account_from_mnemonic(mnemonic: str, index: int = 0, passphrase: str = "") -> Tuple[str, str]:
     """
     Повертає (address, private_key_hex) -> HD derivation m/44'/60'/0'/0/index
-    Ми використовуємо eth-account's Account.from_mnemonic якщо доступно,
-    інакше робимо через встроєні засоби.
+    Для кількох адрес поспіль використовуй derive_accounts — він не перераховує seed.
     """
-    # eth-account recent versions підтримують from_mnemonic
-    try:
-        acct = Account.from_mnemonic(mnemonic, account_path=f"m/44'/60'/0'/0/{index}", passphrase=passphrase)
-        return acct.address, acct.key.hex()
-    except Exception:
-        # fallback (рекомендуємо оновити eth-account)
-        raise RuntimeError("Ваша версія eth-account не підтримує from_mnemonic. Оновіть пакет.")
+    return derive_accounts(mnemonic, 1, passphrase=passphrase, start=index)[0]
 
 
 # --- WEB3 ---
 
 
-def make_web3(rpc_url: str, use_poa: bool = False) -> Web3:
-    w3 = Web3(Web3.HTTPProvider(rpc_url))
+@functools.lru_cache(maxsize=None)
+def http_session(retry_posts: bool = True) -> requests.Session:
+    """
+    Спільна keep-alive сесія з пулом з'єднань, щоб не платити TCP+TLS handshake на кожен RPC.
+    retry_posts=False — для відправки транзакцій: якщо вузол прийняв eth_sendRawTransaction
+    і відповів 502/504, повтор отримає "already known"/"nonce too low" для вже розісланої
+    транзакції. Тоді повторюються лише помилки з'єднання, коли запит ще не дійшов до вузла.
+    Сесія діє лише через SessionHTTPProvider — HTTPProvider(session=...) її може проігнорувати.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=32,
+        pool_maxsize=32,
+        # JSON-RPC ходить лише POST-ом, а типовий Retry POST не повторює
+        max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 502, 503, 504],
+                          allowed_methods=["POST"] if retry_posts else Retry.DEFAULT_ALLOWED_METHODS),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers["Connection"] = "keep-alive"
+    return session
+
+
+class SessionHTTPProvider(HTTPProvider):
+    """
+    HTTPProvider, що ходить через власну сесію. web3 кешує сесії за (потік, URL) і залишає першу,
+    тож другий HTTPProvider(session=...) на той самий URL мовчки отримав би чужу сесію.
+    """
+
+    def __init__(self, endpoint_uri: str, session: requests.Session, request_kwargs: dict = None):
+        super().__init__(endpoint_uri, request_kwargs=request_kwargs)
+        self._session = session
+
+    def make_request(self, method, params):
+        request_data = self.encode_rpc_request(method, params)
+        response = self._session.post(self.endpoint_uri, data=request_data, **self.get_request_kwargs())
+        response.raise_for_status()
+        return self.decode_rpc_response(response.content)
+
+
+@functools.lru_cache(maxsize=4)
+def make_web3(rpc_url: str, use_poa: bool = False, retry_posts: bool = True) -> Web3:
+    provider = SessionHTTPProvider(rpc_url, http_session(retry_posts), request_kwargs={"timeout": 10})
+    if not retry_posts:
+        # вбудований http_retry_request повторює й eth_sendRawTransaction на будь-який HTTPError
+        provider.middlewares = ()
+    w3 = Web3(provider)
     if use_poa:
         # для мереж типу BSC, Polygon (локальні PoA)
         w3.middleware_onion.inject(geth_poa_middleware, layer=0)
@@ -88,9 +182,14 @@ def make_web3(rpc_url: str, use_poa: bool = False) -> Web3:
     return w3
 
 
-def get_eth_balance(w3: Web3, address: str) -> Decimal:
-    wei = w3.eth.get_balance(address)
-    return wei_to_eth(wei)
+# Відмова вузла (web3 v5 піднімає ValueError з JSON-RPC error), HTTP/мережеві збої та
+# нерозбірна відповідь (Multicall3 не задеплоєний) — після них є сенс спробувати послідовні виклики
+RPC_ERRORS = (ValueError, BadFunctionCallOutput, DecodingError, requests.RequestException,
+              aiohttp.ClientError, asyncio.TimeoutError)
+
+
+def get_eth_balance(w3: Web3, address: str) -> int:
+    return w3.eth.get_balance(address)
 
 
 # ERC-20 баланс через standard ABI (balanceOf)
@@ -118,31 +217,303 @@ ERC20_ABI_FRAGMENT = [
     },
 ]
 
+# balanceOf(address) має фіксовану форму, тож calldata збираємо вручну замість ABI-кодера:
+# селектор keccak("balanceOf(address)")[:4] + адреса, доповнена нулями до 32 байт
+_BAL_OF_SEL = bytes.fromhex("70a08231")
+_DECIMALS_CALLDATA = "0x313ce567"
+_SYMBOL_CALLDATA = "0x95d89b41"
+
+
+def balance_of_calldata(user: str) -> str:
+    return "0x" + (_BAL_OF_SEL + bytes(12) + bytes.fromhex(user.removeprefix("0x"))).hex()
+
+
+def decode_uint256(data: bytes) -> int:
+    """Перші 32 байти відповіді як uint256; порожня відповідь (не контракт) — помилка, а не 0."""
+    if len(data) < 32:
+        raise ValueError(f"Некоректна відповідь uint256: 0x{bytes(data).hex()}")
+    return int.from_bytes(data[:32], "big")
+
+
+# Multicall3 задеплоєний за однією адресою в усіх основних EVM-мережах
+MULTICALL3_ADDRESS = "0xcA11bde05977b3631167028862bE2a173976CA11"
+MULTICALL3_ABI = [
+    {
+        "inputs": [
+            {
+                "components": [
+                    {"name": "target", "type": "address"},
+                    {"name": "allowFailure", "type": "bool"},
+                    {"name": "callData", "type": "bytes"},
+                ],
+                "name": "calls",
+                "type": "tuple[]",
+            }
+        ],
+        "name": "aggregate3",
+        "outputs": [
+            {
+                "components": [
+                    {"name": "success", "type": "bool"},
+                    {"name": "returnData", "type": "bytes"},
+                ],
+                "name": "returnData",
+                "type": "tuple[]",
+            }
+        ],
+        "stateMutability": "payable",
+        "type": "function",
+    },
+    {
+        "inputs": [{"name": "addr", "type": "address"}],
+        "name": "getEthBalance",
+        "outputs": [{"name": "balance", "type": "uint256"}],
+        "stateMutability": "view",
+        "type": "function",
+    },
+]
+
+
+@functools.lru_cache(maxsize=None)
+def load_token_meta() -> dict:
+    """
+    Кеш decimals/symbol у вигляді {chain_id: {token: {"decimals": ..., "symbol": ...}}}.
+    Читається з диска один раз за запуск; зміни записуються при виході.
+    """
+    try:
+        with open(_TOKEN_META_PATH) as f:
+            meta = json.load(f)
+    except (OSError, ValueError):
+        meta = {}
+    atexit.register(save_token_meta, meta, json.dumps(meta, sort_keys=True))
+    return meta
+
+
+def save_token_meta(meta: dict, snapshot: str = None):
+    if snapshot is not None and json.dumps(meta, sort_keys=True) == snapshot:
+        return
+    tmp_path = _TOKEN_META_PATH + ".tmp"
+    try:
+        os.makedirs(os.path.dirname(_TOKEN_META_PATH), exist_ok=True)
+        with open(tmp_path, "w") as f:
+            json.dump(meta, f, indent=2)
+        # os.replace атомарний — обірваний запис не зіпсує кеш
+        os.replace(tmp_path, _TOKEN_META_PATH)
+    except OSError:
+        # кеш лише прискорює наступні запуски; недоступний для запису HOME — не помилка
+        pass
+
+
+def remember_token_meta(meta: dict, token: str, decimals, symbol) -> Tuple[int, str]:
+    """
+    decimals/symbol = None означає, що запит не вдався (можливо, тимчасово: 429, revert, таймаут).
+    У кеш потрапляє лише пара, отримана повністю; інакше 18 / "" діють тільки в цьому запуску.
+    """
+    if decimals is not None and symbol is not None:
+        meta[token] = {"decimals": decimals, "symbol": symbol}
+        return decimals, symbol
+    return (18 if decimals is None else decimals), ("" if symbol is None else symbol)
+
+
+@functools.lru_cache(maxsize=4)
+def chain_token_meta(w3: Web3) -> dict:
+    """Частина кешу для поточної мережі, щоб тестнети не змішувались з mainnet."""
+    return load_token_meta().setdefault(str(w3.eth.chain_id), {})
 
-def get_erc20_balance(w3: Web3, token_address: str, user_address: str) -> Tuple[Decimal, int, str]:
-    contract = w3.eth.contract(address=w3.toChecksumAddress(token_address), abi=ERC20_ABI_FRAGMENT)
-    raw = contract.functions.balanceOf(w3.toChecksumAddress(user_address)).call()
+
+def get_erc20_balance(w3: Web3, token_address: str, user_address: str) -> Tuple[int, int, str]:
+    token = w3.toChecksumAddress(token_address)
+    raw = decode_uint256(w3.eth.call({"to": token, "data": balance_of_calldata(w3.toChecksumAddress(user_address))}))
+    meta = chain_token_meta(w3)
+    if token in meta:
+        return raw, meta[token]["decimals"], meta[token]["symbol"]
+    contract = w3.eth.contract(address=token, abi=ERC20_ABI_FRAGMENT)
     try:
         decimals = contract.functions.decimals().call()
     except Exception:
-        decimals = 18
+        decimals = None
     try:
         symbol = contract.functions.symbol().call()
     except Exception:
-        symbol = ""
-    scaled = Decimal(raw) / Decimal(10**decimals)
-    return scaled, decimals, symbol
+        symbol = None
+    return (raw, *remember_token_meta(meta, token, decimals, symbol))
+
+
+def _resolve_token_meta(meta: dict, tokens: List[str], missing: List[str], results: list,
+                        decode) -> dict:
+    """
+    decimals/symbol для tokens: з кешу meta, а для нових токенів (missing) — з results,
+    відповідей на пари запитів (decimals, symbol) у порядку missing.
+    """
+    resolved = {t: (meta[t]["decimals"], meta[t]["symbol"]) for t in tokens if t in meta}
+    for i, t in enumerate(missing):
+        try:
+            decimals = decode(results[2 * i], "uint8")
+        except Exception:
+            decimals = None
+        try:
+            symbol = decode(results[2 * i + 1], "string")
+        except Exception:
+            symbol = None
+        resolved[t] = remember_token_meta(meta, t, decimals, symbol)
+    return resolved
+
+
+def _rpc_batch(endpoint: str, calls: List[Tuple[str, list]], batch_size: int = 100) -> List[dict]:
+    """
+    Надсилає виклики як JSON-RPC батч(і) по batch_size штук.
+    Повертає відповіді в порядку calls (провайдер може переставляти їх у батчі).
+    """
+    responses = []
+    for start in range(0, len(calls), batch_size):
+        chunk = calls[start:start + batch_size]
+        payload = [
+            {"jsonrpc": "2.0", "id": start + i, "method": method, "params": params}
+            for i, (method, params) in enumerate(chunk)
+        ]
+        resp = http_session().post(endpoint, json=payload, timeout=10)
+        resp.raise_for_status()
+        body = resp.json()
+        # частина провайдерів відповідає одиночною помилкою замість масиву
+        if not isinstance(body, list) or len(body) != len(chunk):
+            raise ValueError(f"RPC не підтримує батч-запити: {body}")
+        responses.extend(sorted(body, key=lambda r: r["id"]))
+    return responses
+
+
+def batch_erc20_balances(w3: Web3, user_address: str, tokens: List[str],
+                         batch_size: int = 100) -> Tuple[int, List[Tuple[int, int, str]]]:
+    """Баланс ETH і ERC-20 токенів (у порядку tokens) одним JSON-RPC батчем замість 3N+1 окремих запитів."""
+    user = w3.toChecksumAddress(user_address)
+    tokens = [w3.toChecksumAddress(t) for t in tokens]
+    # calldata однакова для всіх токенів — змінюється лише target
+    balance_data = balance_of_calldata(user)
+
+    meta = chain_token_meta(w3)
+    missing = [t for t in tokens if t not in meta]
+
+    calls = [("eth_getBalance", [user, "latest"])]
+    calls += [("eth_call", [{"to": t, "data": balance_data}, "latest"]) for t in tokens]
+    for t in missing:
+        calls.append(("eth_call", [{"to": t, "data": _DECIMALS_CALLDATA}, "latest"]))
+        calls.append(("eth_call", [{"to": t, "data": _SYMBOL_CALLDATA}, "latest"]))
+
+    responses = _rpc_batch(w3.provider.endpoint_uri, calls, batch_size=batch_size)
+
+    def result(resp):
+        if "error" in resp:
+            raise ValueError(resp["error"])
+        return w3.toBytes(hexstr=resp["result"])
+
+    def decode(resp, typ):
+        return w3.codec.decode_abi([typ], result(resp))[0]
+
+    eth_wei = int(responses[0]["result"], 16)
+    raws = [decode_uint256(result(r)) for r in responses[1:1 + len(tokens)]]
+    resolved = _resolve_token_meta(meta, tokens, missing, responses[1 + len(tokens):], decode)
+
+    return eth_wei, [(raw, *resolved[t]) for t, raw in zip(tokens, raws)]
+
+
+def multicall_erc20_balances(w3: Web3, user_address: str,
+                             tokens: List[str]) -> Tuple[int, List[Tuple[int, int, str]]]:
+    """Баланс ETH і ERC-20 токенів (у порядку tokens) одним eth_call через Multicall3.aggregate3."""
+    user = w3.toChecksumAddress(user_address)
+    tokens = [w3.toChecksumAddress(t) for t in tokens]
+    multicall = w3.eth.contract(address=MULTICALL3_ADDRESS, abi=MULTICALL3_ABI)
+    # calldata однакова для всіх токенів — змінюється лише target
+    balance_data = w3.toBytes(hexstr=balance_of_calldata(user))
+    decimals_data = w3.toBytes(hexstr=_DECIMALS_CALLDATA)
+    symbol_data = w3.toBytes(hexstr=_SYMBOL_CALLDATA)
+
+    meta = chain_token_meta(w3)
+    missing = [t for t in tokens if t not in meta]
+
+    calls = [(MULTICALL3_ADDRESS, False,
+              w3.toBytes(hexstr=multicall.encodeABI(fn_name="getEthBalance", args=[user])))]
+    calls += [(t, False, balance_data) for t in tokens]
+    for t in missing:
+        calls.append((t, True, decimals_data))
+        calls.append((t, True, symbol_data))
+
+    results = multicall.functions.aggregate3(calls).call()
+
+    def return_data(result):
+        success, data = result
+        if not success:
+            raise ValueError("call reverted")
+        return data
+
+    def decode(result, typ):
+        return w3.codec.decode_abi([typ], return_data(result))[0]
+
+    eth_wei = decode_uint256(return_data(results[0]))
+    raws = [decode_uint256(return_data(r)) for r in results[1:1 + len(tokens)]]
+    resolved = _resolve_token_meta(meta, tokens, missing, results[1 + len(tokens):], decode)
+
+    return eth_wei, [(raw, *resolved[t]) for t, raw in zip(tokens, raws)]
+
+
+async def async_erc20_balances(w3: Web3, user_address: str, tokens: List[str],
+                               concurrency: int = 16) -> Tuple[int, List[Tuple[int, int, str]]]:
+    """
+    Баланс ETH і ERC-20 токенів паралельними запитами через AsyncHTTPProvider —
+    для провайдерів, що не приймають ні батчі, ні Multicall3.
+    Одночасно виконується не більше concurrency запитів, щоб публічні RPC не віддавали 429.
+    """
+    user = w3.toChecksumAddress(user_address)
+    meta = chain_token_meta(w3)
+    balance_data = balance_of_calldata(user)
+
+    provider = AsyncHTTPProvider(w3.provider.endpoint_uri)
+    aw3 = Web3(provider, modules={"eth": (AsyncEth,)}, middlewares=[])
+    sem = asyncio.Semaphore(concurrency)
+
+    async def call(token, data, typ):
+        async with sem:
+            raw = await aw3.eth.call({"to": token, "data": data})
+        if typ == "uint256":
+            return decode_uint256(raw)
+        return aw3.codec.decode_abi([typ], raw)[0]
+
+    async def eth_balance():
+        async with sem:
+            return await aw3.eth.get_balance(user)
+
+    async def token_balance(token):
+        token = w3.toChecksumAddress(token)
+        if token in meta:
+            raw = await call(token, balance_data, "uint256")
+            return raw, meta[token]["decimals"], meta[token]["symbol"]
+        raw, decimals, symbol = await asyncio.gather(
+            call(token, balance_data, "uint256"),
+            call(token, _DECIMALS_CALLDATA, "uint8"),
+            call(token, _SYMBOL_CALLDATA, "string"),
+            return_exceptions=True,
+        )
+        if isinstance(raw, Exception):
+            raise raw
+        decimals = None if isinstance(decimals, Exception) else decimals
+        symbol = None if isinstance(symbol, Exception) else symbol
+        return (raw, *remember_token_meta(meta, token, decimals, symbol))
+
+    # один keep-alive пул на весь прогін, як і http_session() у синхронних шляхах
+    connector = aiohttp.TCPConnector(limit=32, keepalive_timeout=30)
+    async with aiohttp.ClientSession(connector=connector) as session:
+        await provider.cache_async_session(session)
+        eth_wei, *balances = await asyncio.gather(eth_balance(), *(token_balance(t) for t in tokens))
+    return eth_wei, balances
 
 
 # --- ТРАНЗАКЦІЇ ---
 
 
-def build_eth_transaction(w3: Web3, from_address: str, to_address: str, value_eth: Decimal, gas: int = None,
-                          gas_price_gwei: Decimal = None, max_priority_fee_gwei: Decimal = None, max_fee_gwei: Decimal = None,
+def build_eth_transaction(w3: Web3, from_address: str, to_address: str, value_wei: int, gas: int = None,
+                          gas_price_wei: int = None, max_priority_fee_wei: int = None, max_fee_wei: int = None,
                           nonce: int = None, chain_id: int = None) -> dict:
     """
     Створює словник транзакції (EIP-1559 якщо задано max_fee/max_priority).
-    Параметри gas/gas_price можуть бути None (буде використано estimate / suggest).
+    Усі суми — цілі wei. Параметри gas/gas_price можуть бути None (буде використано estimate / suggest).
     """
     from_checksum = w3.toChecksumAddress(from_address)
     to_checksum = w3.toChecksumAddress(to_address)
@@ -153,27 +524,23 @@ def build_eth_transaction(w3: Web3, from_address: str, to_address: str, value_et
     tx = {
         "from": from_checksum,
         "to": to_checksum,
-        "value": int(value_eth * Decimal(10**18)),
+        "value": value_wei,
         "nonce": nonce,
         "chainId": chain_id or w3.eth.chain_id,
     }
 
     # EIP-1559
-    if max_fee_gwei is not None and max_priority_fee_gwei is not None:
+    if max_fee_wei is not None and max_priority_fee_wei is not None:
         tx["type"] = "0x2"
-        tx["maxFeePerGas"] = int(max_fee_gwei * Decimal(10**9))
-        tx["maxPriorityFeePerGas"] = int(max_priority_fee_gwei * Decimal(10**9))
+        tx["maxFeePerGas"] = max_fee_wei
+        tx["maxPriorityFeePerGas"] = max_priority_fee_wei
         if gas is None:
             tx["gas"] = w3.eth.estimate_gas({k: v for k, v in tx.items() if k in ("to", "value", "from")})
         else:
             tx["gas"] = gas
     else:
         # legacy
-        if gas_price_gwei is None:
-            gas_price = w3.eth.gas_price
-        else:
-            gas_price = int(gas_price_gwei * Decimal(10**9))
-        tx["gasPrice"] = gas_price
+        tx["gasPrice"] = w3.eth.gas_price if gas_price_wei is None else gas_price_wei
         if gas is None:
             tx["gas"] = w3.eth.estimate_gas({"to": to_checksum, "from": from_checksum, "value": tx["value"]})
         else:
@@ -219,8 +586,7 @@ def cmd_generate(args):
     safe_print(mnemonic)
     safe_print("")
     safe_print("Deriving first 3 addresses:")
-    for i in range(3):
-        addr, pk = derive_account_from_mnemonic(mnemonic, index=i, passphrase=args.passphrase or "")
+    for i, (addr, pk) in enumerate(derive_accounts(mnemonic, 3, passphrase=args.passphrase or "")):
         safe_print(f"[{i}] {addr}  (private key HIDDEN)")
     safe_print("\nЗбережіть мнемоніку у безпечному місці.")
 
@@ -229,24 +595,34 @@ def cmd_derive(args):
     mnemonic = args.mnemonic
     if not mnemonic:
         mnemonic = getpass.getpass("Введіть мнемоніку: ")
-    for i in range(args.count):
-        addr, pk = derive_account_from_mnemonic(mnemonic, index=i, passphrase=args.passphrase or "")
+    for i, (addr, pk) in enumerate(derive_accounts(mnemonic, args.count, passphrase=args.passphrase or "")):
         safe_print(f"{i}: {addr}  (privkey: {pk})")
 
 
 def cmd_balance(args):
     w3 = make_web3(args.rpc, use_poa=args.poa)
     addr = w3.toChecksumAddress(args.address)
-    eth_bal = get_eth_balance(w3, addr)
-    safe_print(f"ETH balance of {addr}: {eth_bal} ETH")
-    if args.erc20:
-        for t in args.erc20:
-            bal, decs, sym = get_erc20_balance(w3, t, addr)
-            safe_print(f"Token {sym or t} balance: {bal} (decimals: {decs})")
+    tokens = args.erc20 or []
+    try:
+        if args.method == "multicall":
+            eth_wei, token_bals = multicall_erc20_balances(w3, addr, tokens)
+        elif args.method == "async":
+            eth_wei, token_bals = asyncio.run(async_erc20_balances(w3, addr, tokens))
+        else:
+            eth_wei, token_bals = batch_erc20_balances(w3, addr, tokens, batch_size=args.batch_size)
+    except RPC_ERRORS as e:
+        # Multicall3 не задеплоєний / провайдер не приймає батчі — послідовні виклики
+        safe_print(f"{args.method}: {e!r}; переходжу на послідовні запити")
+        eth_wei = get_eth_balance(w3, addr)
+        token_bals = [get_erc20_balance(w3, t, addr) for t in tokens]
+    safe_print(f"ETH balance of {addr}: {wei_to_eth(eth_wei)} ETH")
+    for t, (raw, decs, sym) in zip(tokens, token_bals):
+        safe_print(f"Token {sym or t} balance: {format_units(raw, decs)} (decimals: {decs})")
 
 
 def cmd_send(args):
-    w3 = make_web3(args.rpc, use_poa=args.poa)
+    # без повторів POST: відправку транзакції не можна безпечно повторювати
+    w3 = make_web3(args.rpc, use_poa=args.poa, retry_posts=False)
     # приватний ключ з environment або введи вручну
     if args.privkey:
         priv = args.privkey
@@ -255,7 +631,8 @@ def cmd_send(args):
     acct = Account.from_key(priv)
     from_addr = acct.address
     to = args.to
-    value = Decimal(args.value)
+    # Decimal лише на межі CLI — далі все в цілих wei
+    value_wei = eth_to_wei(Decimal(args.value))
     chain_id = args.chain_id or w3.eth.chain_id
 
     # Параметри газу
@@ -263,11 +640,11 @@ def cmd_send(args):
         w3,
         from_addr,
         to,
-        value_eth=value,
+        value_wei=value_wei,
         gas=args.gas,
-        gas_price_gwei=Decimal(args.gas_price) if args.gas_price else None,
-        max_priority_fee_gwei=Decimal(args.max_priority_fee) if args.max_priority_fee else None,
-        max_fee_gwei=Decimal(args.max_fee) if args.max_fee else None,
+        gas_price_wei=gwei_to_wei(Decimal(args.gas_price)) if args.gas_price else None,
+        max_priority_fee_wei=gwei_to_wei(Decimal(args.max_priority_fee)) if args.max_priority_fee else None,
+        max_fee_wei=gwei_to_wei(Decimal(args.max_fee)) if args.max_fee else None,
         nonce=args.nonce,
         chain_id=chain_id
     )
@@ -300,6 +677,13 @@ def cmd_verify_msg(args):
     safe_print(f"Recovered signer: {signer}")
 
 
+def positive_int(value: str) -> int:
+    n = int(value)
+    if n <= 0:
+        raise argparse.ArgumentTypeError(f"очікується додатне число, отримано {value}")
+    return n
+
+
 def build_parser():
     p = argparse.ArgumentParser(description="AtlasCryptoKit — локальний крипто-тул для Ethereum-сумісних мереж")
     p.add_argument("--rpc", type=str, default=os.environ.get("ATLAS_RPC", DEFAULT_RPC), help="RPC URL")
@@ -320,6 +704,12 @@ def build_parser():
     b = sub.add_parser("balance", help="Перевірити баланс ETH та ERC-20")
     b.add_argument("address", type=str, help="Адреса для перевірки")
     b.add_argument("--erc20", nargs="*", help="Списком адреси контрактів ERC20")
+    b.add_argument("--method", choices=("multicall", "batch", "async"), default="multicall",
+                   help="multicall — один eth_call через Multicall3; batch — JSON-RPC батч; "
+                        "async — паралельні запити")
+    b.add_argument("--concurrent", action="store_const", const="async", dest="method",
+                   help="Те саме, що --method async")
+    b.add_argument("--batch-size", type=positive_int, default=100, dest="batch_size", help="Макс. кількість викликів в одному JSON-RPC батчі")
     b.set_defaults(func=cmd_balance)
 
     s = sub.add_parser("send", help="Створити, підписати і (опційно) відправити транзакцію")
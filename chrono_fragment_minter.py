@@ -1,29 +1,42 @@
 # file: chrono_fragment_minter.py
-# No external libraries required
+# Requires: pip install numpy (optional: orjson)
 # Usage: python chrono_fragment_minter.py
 
 import os
-import random
-import hashlib
-from datetime import datetime, timedelta
+import json
+from datetime import datetime, timedelta, timezone
 
+import numpy as np
 
-def random_hash():
-    """Створює псевдо-криптографічний хеш."""
-    raw = str(random.random()).encode()
-    return hashlib.sha1(raw).hexdigest()
+try:
+    import orjson
+except ImportError:  # orjson необов'язковий
+    orjson = None
+
+rng = np.random.default_rng()
+
+
+def dump_json(meta):
+    if orjson is not None:
+        return orjson.dumps(meta, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(meta, indent=2).encode()
 
 
 def generate_fragment(lines=40):
     """Генерує 'часовий фрагмент' із шумом."""
     fragment = ["# Chrono-Fragment Data\n"]
-    start = datetime.utcnow()
+    # naive UTC, як і раніше: рядки нижче самі дописують "Z"
+    start = datetime.now(timezone.utc).replace(tzinfo=None)
+    # 6 байт шуму на рядок (12 hex-символів) — одним читанням замість хешу на кожен рядок
+    entropy_bytes = os.urandom(6 * lines)
+    deltas = rng.integers(1, 5001, size=lines).tolist()
+    entropies = rng.uniform(0.001, 0.999, lines).tolist()
 
     for i in range(lines):
-        delta = timedelta(seconds=random.randint(1, 5000))
+        delta = timedelta(seconds=deltas[i])
         t = start + delta
-        noise = random_hash()[:12]
-        entropy = random.uniform(0.001, 0.999)
+        noise = entropy_bytes[i * 6:(i + 1) * 6].hex()
+        entropy = entropies[i]
 
         fragment.append(
             f"{t.isoformat()}Z | Δ={delta.total_seconds():.0f}s | sig:{noise} | ent:{entropy:.3f}"
@@ -41,23 +54,22 @@ def save_metadata(path, lines):
     meta = {
         "file": os.path.basename(path),
         "entries": lines,
-        "generated_at": datetime.utcnow().isoformat() + "Z",
+        "generated_at": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
         "format": "chrono-fragment",
         "description": "Synthetic temporal fragment asset for GitHub releases.",
-        "entropy_seed": random.randint(1000000, 9999999),
+        "entropy_seed": int(rng.integers(1000000, 10000000)),
         "version": "1.0",
         "tags": ["time", "fragment", "synthetic", "asset"]
     }
-    with open(path + ".json", "w") as f:
-        import json
-        json.dump(meta, f, indent=2)
+    with open(path + ".json", "wb") as f:
+        f.write(dump_json(meta))
 
 
 def main():
     out_dir = "chrono_fragments"
     os.makedirs(out_dir, exist_ok=True)
 
-    name = f"fragment_{random.randint(1000, 9999)}.txt"
+    name = f"fragment_{rng.integers(1000, 10000)}.txt"
     full_path = os.path.join(out_dir, name)
 
     print(f"🌀 Minting chrono-fragment: {name}")
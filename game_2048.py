@@ -1,11 +1,15 @@
 # file: game_2048.py
-# Requires: Python 3 (tkinter included in standard library)
+# Requires: Python 3 (tkinter included in standard library), pip install numpy numba
 # Usage: python game_2048.py
 
 import tkinter as tk
+import os
 import random
 import sys
 
+import numpy as np
+from numba import njit
+
 GRID_LEN = 4
 CELL_SIZE = 100
 PADDING = 10
@@ -29,6 +33,156 @@ TILE_COLORS = {
     2048: ("#edc22e", "#f9f6f2"),
 }
 
+
+# The board is a single 64-bit int: 16 cells of 4 bits, each holding a log2(tile)
+# exponent (0 is an empty cell, 1 is a "2", 2 is a "4", ... up to 2**15).
+# Row i lives in bits 16*i..16*i+15, and column j of a row in bits 4*j..4*j+3.
+MAX_EXP = 15
+ROW_MASK = 0xFFFF
+# GAME2048_ROW_TABLES=0 swaps the 1 MB of row tables (4 x 65536 uint32) for the SWAR row kernel
+USE_ROW_TABLES = os.environ.get("GAME2048_ROW_TABLES", "1") != "0"
+
+
+@njit(cache=True)
+def move_left_kernel(rows):
+    """Slide and merge each row of exponents to the left; returns (new_rows, row_gains)"""
+    n, cols = rows.shape
+    out = np.zeros_like(rows)
+    gains = np.zeros(n, dtype=np.uint32)
+    for i in range(n):
+        k = 0
+        last = 0
+        for j in range(cols):
+            v = rows[i, j]
+            if v == 0:
+                continue
+            if v == last and v < MAX_EXP:
+                # merge into the previously placed tile; a merged tile can't merge again
+                out[i, k - 1] = v + 1
+                gains[i] += 1 << (v + 1)
+                last = 0
+            else:
+                out[i, k] = v
+                last = v
+                k += 1
+    return out, gains
+
+
+def reverse_rows(rows):
+    """Reverse the four nibbles of each 16-bit row"""
+    return ((rows & 0xF) << 12) | (((rows >> 4) & 0xF) << 8) | (((rows >> 8) & 0xF) << 4) | (rows >> 12)
+
+
+def build_row_tables():
+    """Run the kernel once over every possible 16-bit row"""
+    rows = np.arange(1 << 16, dtype=np.uint32)
+    shifts = 4 * np.arange(GRID_LEN, dtype=np.uint32)
+    cells = ((rows[:, None] >> shifts) & 0xF).astype(np.uint8)
+    moved, gains = move_left_kernel(cells)
+    left = (moved.astype(np.uint32) << shifts).sum(axis=1, dtype=np.uint32)
+    reversed_rows = reverse_rows(rows)
+    right = reverse_rows(left[reversed_rows])
+    return left, gains, right, gains[reversed_rows]
+
+
+@njit(cache=True)
+def compress_row(row):
+    """Slide non-zero nibbles of a 16-bit row to the left in three branchless passes"""
+    for i in range(GRID_LEN - 2, -1, -1):
+        low = (1 << (4 * i)) - 1
+        shifted = (row & low) | ((row >> 4) & ~low)
+        # all-ones when nibble i is empty, so the select below compiles to a cmov
+        mask = -int(((row >> (4 * i)) & 0xF) == 0) & ROW_MASK
+        row = (shifted & mask) | (row & ~mask)
+    return row
+
+
+@njit(cache=True)
+def move_left_row(row):
+    """SWAR slide and merge of one 16-bit row; returns (new_row, score_gain)"""
+    row = compress_row(row)
+    # nibble i of diff is 0 when nibbles i and i+1 hold the same exponent
+    diff = row ^ (row >> 4)
+    score_gain = 0
+    merged = 0
+    for i in range(GRID_LEN - 1):
+        v = (row >> (4 * i)) & 0xF
+        m = int(((diff >> (4 * i)) & 0xF) == 0) & int(v != 0) & int(v < MAX_EXP) & (1 - merged)
+        # bump nibble i, clear nibble i+1
+        row = row + (m << (4 * i)) - ((v * m) << (4 * i + 4))
+        score_gain += m << (v + 1)
+        merged = m
+    return compress_row(row), score_gain
+
+
+if USE_ROW_TABLES:
+    ROW_LEFT, ROW_LEFT_SCORE, ROW_RIGHT, ROW_RIGHT_SCORE = build_row_tables()
+
+    def row_left(row):
+        return int(ROW_LEFT[row]), int(ROW_LEFT_SCORE[row])
+
+    def row_right(row):
+        return int(ROW_RIGHT[row]), int(ROW_RIGHT_SCORE[row])
+else:
+    # compile the kernel now rather than on the first key press
+    move_left_row(0)
+    row_left = move_left_row
+
+    def row_right(row):
+        new_row, score_gain = move_left_row(reverse_rows(row))
+        return reverse_rows(new_row), score_gain
+
+
+def move_rows(board, row_move):
+    new_board = 0
+    score_gain = 0
+    for i in range(GRID_LEN):
+        new_row, gain = row_move((board >> (16 * i)) & ROW_MASK)
+        new_board |= new_row << (16 * i)
+        score_gain += gain
+    return new_board, score_gain
+
+
+def transpose(board):
+    a1 = board & 0xF0F00F0FF0F00F0F
+    a2 = board & 0x0000F0F00000F0F0
+    a3 = board & 0x0F0F00000F0F0000
+    a = a1 | (a2 << 12) | (a3 >> 12)
+    b1 = a & 0xFF00FF0000FF00FF
+    b2 = a & 0x00FF00FF00000000
+    b3 = a & 0x00000000FF00FF00
+    return b1 | (b2 >> 24) | (b3 << 24)
+
+
+def move_left(board):
+    return move_rows(board, row_left)
+
+
+def move_right(board):
+    return move_rows(board, row_right)
+
+
+def move_up(board):
+    new_board, score_gain = move_left(transpose(board))
+    return transpose(new_board), score_gain
+
+
+def move_down(board):
+    new_board, score_gain = move_right(transpose(board))
+    return transpose(new_board), score_gain
+
+
+def cell_exp(board, i, j):
+    return (board >> (4 * (GRID_LEN * i + j))) & 0xF
+
+
+def zero_nibble_mask(board):
+    """Bit 4*k is set for every empty cell k"""
+    x = board | (board >> 1)
+    x |= x >> 2
+    return ~x & 0x1111111111111111
+
+
 class Game2048:
     def __init__(self, master):
         self.master = master
@@ -54,8 +208,8 @@ class Game2048:
         master.bind("<Key>", self.key_handler)
 
     def reset_game(self):
-        self.grid = [[0] * GRID_LEN for _ in range(GRID_LEN)]
-        self.previous_grid = None
+        self.board = 0
+        self.previous_board = None
         self.previous_score = 0
         self.score = 0
         self.add_random_tile()
@@ -84,97 +238,51 @@ class Game2048:
     def update_grid_cells(self):
         for i in range(GRID_LEN):
             for j in range(GRID_LEN):
-                value = self.grid[i][j]
+                exp = cell_exp(self.board, i, j)
+                value = 1 << exp if exp else 0
                 bg_color, fg_color = TILE_COLORS.get(value, ("#3c3a32", "#f9f6f2"))
                 self.cells[i][j].configure(text=str(value) if value != 0 else "", bg=bg_color, fg=fg_color)
         self.score_label.configure(text=f"Score: {self.score}")
         self.master.update_idletasks()
 
     def add_random_tile(self):
-        empty = [(i, j) for i in range(GRID_LEN) for j in range(GRID_LEN) if self.grid[i][j] == 0]
-        if not empty:
+        zmask = zero_nibble_mask(self.board)
+        empties = bin(zmask).count("1")
+        if not empties:
             return False
-        i, j = random.choice(empty)
-        self.grid[i][j] = 4 if random.random() < 0.1 else 2
+        # drop the lowest k empty cells, then land on the next one
+        for _ in range(random.randrange(empties)):
+            zmask &= zmask - 1
+        shift = (zmask & -zmask).bit_length() - 1
+        self.board |= (2 if random.random() < 0.1 else 1) << shift
         return True
 
-    # movement helpers
-    @staticmethod
-    def compress(row):
-        """Slide non-zero to the left"""
-        new_row = [num for num in row if num != 0]
-        new_row += [0] * (len(row) - len(new_row))
-        return new_row
-
-    @staticmethod
-    def merge(row):
-        """Merge row after compressing; returns new row and score gained"""
-        score_gain = 0
-        for i in range(len(row)-1):
-            if row[i] != 0 and row[i] == row[i+1]:
-                row[i] *= 2
-                row[i+1] = 0
-                score_gain += row[i]
-        return row, score_gain
+    # movement helpers: every move works row by row on the bitboard through the row_left/row_right shims
+    def apply_move(self, move):
+        new_board, score_gain = move(self.board)
+        if new_board == self.board:
+            return False
+        self.previous_board = self.board
+        self.previous_score = self.score
+        self.board = new_board
+        self.score += score_gain
+        self.add_random_tile()
+        return True
 
     def move_left(self):
-        moved = False
-        total_gain = 0
-        new_grid = []
-        for i in range(GRID_LEN):
-            compressed = self.compress(self.grid[i])
-            merged, gain = self.merge(compressed)
-            final = self.compress(merged)
-            new_grid.append(final)
-            if final != self.grid[i]:
-                moved = True
-            total_gain += gain
-        if moved:
-            self.previous_grid = [row[:] for row in self.grid]
-            self.previous_score = self.score
-            self.grid = new_grid
-            self.score += total_gain
-            self.add_random_tile()
-        return moved
+        return self.apply_move(move_left)
 
     def move_right(self):
-        self.reflect_horizontal()
-        moved = self.move_left()
-        self.reflect_horizontal()
-        return moved
+        return self.apply_move(move_right)
 
     def move_up(self):
-        self.transpose()
-        moved = self.move_left()
-        self.transpose()
-        return moved
+        return self.apply_move(move_up)
 
     def move_down(self):
-        self.transpose()
-        moved = self.move_right()
-        self.transpose()
-        return moved
-
-    def transpose(self):
-        self.grid = [list(row) for row in zip(*self.grid)]
-
-    def reflect_horizontal(self):
-        self.grid = [list(reversed(row)) for row in self.grid]
+        return self.apply_move(move_down)
 
     def can_move(self):
-        # if any empty cell, can move
-        if any(self.grid[i][j] == 0 for i in range(GRID_LEN) for j in range(GRID_LEN)):
-            return True
-        # check merges possible
-        for i in range(GRID_LEN):
-            for j in range(GRID_LEN-1):
-                if self.grid[i][j] == self.grid[i][j+1]:
-                    return True
-        for j in range(GRID_LEN):
-            for i in range(GRID_LEN-1):
-                if self.grid[i][j] == self.grid[i+1][j]:
-                    return True
-        return False
+        return any(move(self.board)[0] != self.board for move in (move_left, move_right, move_up, move_down))
 
     def key_handler(self, event):
         key = event.keysym
@@ -208,10 +316,10 @@ class Game2048:
         tk.Button(over, text="Quit", command=self.master.quit).pack(pady=5)
 
     def undo(self):
-        if self.previous_grid is not None:
-            self.grid = [row[:] for row in self.previous_grid]
+        if self.previous_board is not None:
+            self.board = self.previous_board
             self.score = self.previous_score
-            self.previous_grid = None
+            self.previous_board = None
             self.update_grid_cells()
 
 def main():
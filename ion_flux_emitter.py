@@ -1,47 +1,58 @@
 # file: ion_flux_emitter.py
-# No external libs
+# Requires: pip install numpy (optional: orjson)
 # Usage: python ion_flux_emitter.py
 
 import os
 import json
-import random
-import math
-from datetime import datetime
+from datetime import datetime, timezone
+
+import numpy as np
+
+try:
+    import orjson
+except ImportError:  # orjson необов'язковий
+    orjson = None
+
+rng = np.random.default_rng()
+
+def dump_json(meta):
+    if orjson is not None:
+        return orjson.dumps(meta, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(meta, indent=2).encode()
 
 def generate_ion_values(count=256):
-    values = []
-    for i in range(count):
-        # псевдо-фізична формула для вигляду "реального" шуму
-        angle = i * random.uniform(0.01, 0.05)
-        flux = math.sin(angle) * random.uniform(0.5, 3.0) + random.uniform(-0.2, 0.2)
-        values.append(round(flux, 6))
-    return values
+    # псевдо-фізична формула для вигляду "реального" шуму
+    angles = np.arange(count) * rng.uniform(0.01, 0.05, count)
+    amps = rng.uniform(0.5, 3.0, count)
+    noise = rng.uniform(-0.2, 0.2, count)
+    return np.round(np.sin(angles) * amps + noise, 6)
 
 def write_dat(path, values):
     with open(path, "w") as f:
         f.write("# Ion flux signature data\n")
-        for v in values:
-            f.write(f"{v}\n")
+        # tofile форматує весь масив у C, без Python-виклику на кожне значення
+        values.tofile(f, sep="\n", format="%.6f")
+        f.write("\n")
 
 def write_metadata(path, count):
     meta = {
         "file": os.path.basename(path),
         "entries": count,
-        "generated_at": datetime.utcnow().isoformat() + "Z",
+        "generated_at": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
         "type": "ion-flux-dataset",
         "description": "Randomly generated ion flux emission dataset for GitHub release assets.",
-        "noise_profile": f"{random.uniform(0.1, 1.0):.3f}",
-        "signature_id": random.randint(100000, 999999),
+        "noise_profile": f"{rng.uniform(0.1, 1.0):.3f}",
+        "signature_id": int(rng.integers(100000, 1000000)),
         "tags": ["ion", "flux", "dataset", "random"]
     }
-    with open(path + ".json", "w") as f:
-        json.dump(meta, f, indent=2)
+    with open(path + ".json", "wb") as f:
+        f.write(dump_json(meta))
 
 def main():
     out_dir = "ion_flux_output"
     os.makedirs(out_dir, exist_ok=True)
 
-    name = f"flux_{random.randint(1000,9999)}.dat"
+    name = f"flux_{rng.integers(1000, 10000)}.dat"
     full_path = os.path.join(out_dir, name)
 
     print(f"✨ Generating ion flux dataset: {name}")
@@ -1,37 +1,49 @@
 # file: lunar_echo_constructor.py
-# No external libraries required
+# Requires: pip install numpy (optional: orjson)
 # Usage: python lunar_echo_constructor.py
 
 import os
-import random
-import math
-from datetime import datetime
+from datetime import datetime, timezone
 import json
 
+import numpy as np
+
+try:
+    import orjson
+except ImportError:  # orjson необов'язковий
+    orjson = None
+
+rng = np.random.default_rng()
+
+
+def dump_json(meta):
+    if orjson is not None:
+        return orjson.dumps(meta, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(meta, indent=2).encode()
+
 
 def generate_wave_points(count=180):
     """Генерує хвильові точки для 'місячного ехо'."""
-    points = []
-    freq = random.uniform(0.2, 1.4)
-    amp = random.uniform(0.8, 2.5)
-    noise = random.uniform(0.01, 0.2)
+    freq = rng.uniform(0.2, 1.4)
+    amp = rng.uniform(0.8, 2.5)
+    noise = rng.uniform(0.01, 0.2)
 
-    for i in range(count):
-        x = i
-        wave = math.sin(i * freq) * amp
-        distorted = wave + (random.uniform(-noise, noise))
-        points.append(round(distorted, 6))
+    i = np.arange(count)
+    wave = np.sin(i * freq) * amp
+    distorted = wave + rng.uniform(-noise, noise, count)
 
-    return points, freq, amp, noise
+    return np.round(distorted, 6).tolist(), freq, amp, noise
 
 
 def save_lec_file(path, points, freq, amp, noise):
     """Зберігає файл формату LEC."""
+    body = "\n".join(f"{p:.6f}" for p in points)
     with open(path, "w") as f:
-        f.write("# Lunar Echo Capture (LEC)\n")
-        f.write(f"# points={len(points)} freq={freq:.3f} amp={amp:.3f} noise={noise:.3f}\n")
-        for p in points:
-            f.write(f"{p}\n")
+        f.write(
+            "# Lunar Echo Capture (LEC)\n"
+            f"# points={len(points)} freq={freq:.3f} amp={amp:.3f} noise={noise:.3f}\n"
+            f"{body}\n"
+        )
 
 
 def save_metadata(path, size, freq, amp, noise):
@@ -42,19 +54,19 @@ def save_metadata(path, size, freq, amp, noise):
         "frequency": freq,
         "amplitude": amp,
         "noise_factor": noise,
-        "generated_at": datetime.utcnow().isoformat() + "Z",
+        "generated_at": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
         "description": "Synthetic lunar echo wave dataset for GitHub assets.",
         "tags": ["lunar", "echo", "wave", "synthetic", "asset"]
     }
-    with open(path + ".json", "w") as f:
-        json.dump(meta, f, indent=2)
+    with open(path + ".json", "wb") as f:
+        f.write(dump_json(meta))
 
 
 def main():
     out_dir = "lunar_echo_output"
     os.makedirs(out_dir, exist_ok=True)
 
-    name = f"lunar_echo_{random.randint(1000,9999)}.lec"
+    name = f"lunar_echo_{rng.integers(1000, 10000)}.lec"
     full_path = os.path.join(out_dir, name)
 
     print(f"🌙 Constructing lunar echo: {name}")
@@ -1,32 +1,76 @@
 # file: nebula_asset_maker.py
-# Requires: pip install pillow
+# Requires: pip install pillow numpy (optional: orjson)
 # Usage: python nebula_asset_maker.py
 
-import os, json, random, math
-from datetime import datetime
-from PIL import Image, ImageDraw
+import os, json, functools
+from datetime import datetime, timezone
+import numpy as np
+from PIL import Image
 
-def random_color():
-    return tuple(random.randint(0, 255) for _ in range(3))
+try:
+    import orjson
+except ImportError:  # orjson необов'язковий
+    orjson = None
+
+rng = np.random.default_rng()
+
+def dump_json(meta):
+    if orjson is not None:
+        return orjson.dumps(meta, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(meta, indent=2).encode()
+
+MAX_RADIUS = 400
+
+@functools.lru_cache(maxsize=1)
+def distance_grid():
+    """
+    Відстані від центру (округлені вгору) для найбільшого шару; менші шари беруть з неї зріз.
+    Кільце з кроком 5 px покриває піксель тоді ж, коли і його округлену відстань,
+    тож ціле значення достатнє для вибору з таблиці.
+    """
+    yy, xx = np.ogrid[-MAX_RADIUS:MAX_RADIUS + 1, -MAX_RADIUS:MAX_RADIUS + 1]
+    return np.ceil(np.sqrt(xx * xx + yy * yy)).astype(np.intp)
+
+def radial_alpha(radius):
+    """
+    Маска непрозорості шару: еквівалент концентричних кіл з кроком 5 px,
+    де кожне кільце має alpha = (1 - r/radius) * 0.5 і накладається поверх попередніх.
+    """
+    rings = np.arange(radius, 0, -5)
+    ring_alpha = (255 * (1 - rings / radius) * 0.5).astype(int) / 255
+    # непрозорість після k-го кільця (від зовнішнього до центру)
+    opacity = 1 - np.cumprod(1 - ring_alpha)
+    # таблиця: ціла відстань -> непрозорість; все, що далі radius, прозоре
+    d = np.arange(radius + 1)
+    lut = np.zeros(2 * MAX_RADIUS)
+    lut[:radius + 1] = opacity[np.minimum((radius - d) // 5, len(rings) - 1)]
+    dist = distance_grid()[MAX_RADIUS - radius:MAX_RADIUS + radius + 1, MAX_RADIUS - radius:MAX_RADIUS + radius + 1]
+    return lut.astype(np.float32)[dist]
 
 def generate_nebula(width=800, height=800, layers=12):
-    img = Image.new("RGB", (width, height), (0, 0, 0))
-    draw = ImageDraw.Draw(img, "RGBA")
-    for _ in range(layers):
-        x, y = random.randint(0, width), random.randint(0, height)
-        radius = random.randint(100, 400)
-        color = (*random_color(), random.randint(40, 120))
-        for r in range(radius, 0, -5):
-            alpha = int(255 * (1 - r / radius) * 0.5)
-            c = (*color[:3], alpha)
-            draw.ellipse((x - r, y - r, x + r, y + r), fill=c)
-    return img
+    # вся математика в одному суцільному float32 RGB буфері; в uint8 переводимо один раз у кінці
+    canvas = np.zeros((height, width, 3), dtype=np.float32)
+    xs = rng.integers(0, width + 1, layers).tolist()
+    ys = rng.integers(0, height + 1, layers).tolist()
+    radii = rng.integers(100, MAX_RADIUS + 1, layers).tolist()
+    colors = rng.integers(0, 256, (layers, 3)).astype(np.float32)
+    for x, y, radius, color in zip(xs, ys, radii, colors):
+        alpha = radial_alpha(radius)
+        # обрізаємо маску по краях полотна
+        x0, x1 = max(x - radius, 0), min(x + radius + 1, width)
+        y0, y1 = max(y - radius, 0), min(y + radius + 1, height)
+        a = alpha[y0 - (y - radius):y1 - (y - radius), x0 - (x - radius):x1 - (x - radius), None]
+        patch = canvas[y0:y1, x0:x1]
+        blend = color - patch
+        blend *= a
+        patch += blend
+    return Image.fromarray(np.clip(canvas + 0.5, 0, 255).astype(np.uint8), "RGB")
 
 def make_metadata(filename, width, height):
     return {
         "name": filename,
         "type": "nebula-art",
-        "created_at": datetime.utcnow().isoformat() + "Z",
+        "created_at": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
         "size": f"{width}x{height}",
         "tags": ["nebula", "random", "asset", "github"],
         "description": "Procedurally generated nebula asset for GitHub releases."
@@ -36,17 +80,18 @@ def main():
     out_dir = "nebula_assets"
     os.makedirs(out_dir, exist_ok=True)
 
-    name = f"nebula_{random.randint(1000,9999)}"
+    name = f"nebula_{rng.integers(1000, 10000)}"
     img_path = os.path.join(out_dir, f"{name}.png")
     meta_path = os.path.join(out_dir, f"{name}.json")
 
     print(f"🌀 Generating {name} ...")
     img = generate_nebula()
-    img.save(img_path)
+    # zlib — основна ціна запису PNG; рівень 1 замість типового 6
+    img.save(img_path, format="PNG", compress_level=1)
 
     metadata = make_metadata(f"{name}.png", 800, 800)
-    with open(meta_path, "w") as f:
-        json.dump(metadata, f, indent=2)
+    with open(meta_path, "wb") as f:
+        f.write(dump_json(metadata))
 
     print(f"✅ Created {img_path} and {meta_path}")
     print("Upload these as assets to your GitHub release!")
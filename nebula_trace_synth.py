@@ -1,39 +1,50 @@
 # file: nebula_trace_synth.py
-# No external libraries required
+# Requires: pip install numpy (optional: orjson)
 # Usage: python nebula_trace_synth.py
 
 import os
-import random
-import math
 import json
-from datetime import datetime
+from datetime import datetime, timezone
 
+import numpy as np
+
+try:
+    import orjson
+except ImportError:  # orjson необов'язковий
+    orjson = None
+
+rng = np.random.default_rng()
 
-def generate_trace_points(count=150):
-    """Генерує векторні точки космічної 'туманності'."""
-    points = []
-    swirl = random.uniform(0.3, 1.2)
-    chaos = random.uniform(0.01, 0.15)
 
-    for i in range(count):
-        angle = i * swirl
-        radius = i * random.uniform(0.7, 1.3)
+def dump_json(meta):
+    if orjson is not None:
+        return orjson.dumps(meta, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(meta, indent=2).encode()
+
+
+def generate_trace_points(count=150):
+    """Генерує векторні точки космічної 'туманності' — масив (count, 2)."""
+    swirl = rng.uniform(0.3, 1.2)
+    chaos = rng.uniform(0.01, 0.15)
 
-        x = radius * math.cos(angle) + random.uniform(-chaos, chaos)
-        y = radius * math.sin(angle) + random.uniform(-chaos, chaos)
+    i = np.arange(count)
+    angle = i * swirl
+    radius = i * rng.uniform(0.7, 1.3, count)
 
-        points.append((round(x, 4), round(y, 4)))
+    x = radius * np.cos(angle) + rng.uniform(-chaos, chaos, count)
+    y = radius * np.sin(angle) + rng.uniform(-chaos, chaos, count)
 
+    points = np.stack([np.round(x, 4), np.round(y, 4)], axis=1)
     return points, swirl, chaos
 
 
 def save_ntrace(path, points, swirl, chaos):
     """Формує файл вигаданого формату .ntrace."""
-    with open(path, "w") as f:
-        f.write("# Nebula Trace File (.ntrace)\n")
-        f.write(f"# swirl={swirl:.3f} chaos={chaos:.3f} entries={len(points)}\n")
-        for x, y in points:
-            f.write(f"{x},{y}\n")
+    header = (
+        "Nebula Trace File (.ntrace)\n"
+        f"swirl={swirl:.3f} chaos={chaos:.3f} entries={len(points)}"
+    )
+    np.savetxt(path, points, fmt="%.4f,%.4f", header=header)
 
 
 def save_metadata(path, points, swirl, chaos):
@@ -43,19 +54,19 @@ def save_metadata(path, points, swirl, chaos):
         "entries": len(points),
         "swirl_factor": swirl,
         "chaos_factor": chaos,
-        "generated_at": datetime.utcnow().isoformat() + "Z",
+        "generated_at": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
         "description": "Procedurally generated nebula vector trace for GitHub assets.",
         "tags": ["nebula", "trace", "vector", "synthetic", "asset"]
     }
-    with open(path + ".json", "w") as f:
-        json.dump(meta, f, indent=2)
+    with open(path + ".json", "wb") as f:
+        f.write(dump_json(meta))
 
 
 def main():
     out_dir = "nebula_traces"
     os.makedirs(out_dir, exist_ok=True)
 
-    name = f"trace_{random.randint(1000,9999)}.ntrace"
+    name = f"trace_{rng.integers(1000, 10000)}.ntrace"
     full_path = os.path.join(out_dir, name)
 
     print(f"✨ Synthesizing nebula trace: {name}")
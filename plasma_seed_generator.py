@@ -4,22 +4,29 @@
 
 import os
 import random
+import base64
 import hashlib
+import secrets
 import json
-from datetime import datetime
+from datetime import datetime, timezone
+from pathlib import Path
 
 
 ALPHABET = "ABCDEFGHJKLMNPQRSTUVWXYZ23456789"  # без легко плутаних символів
+# 32 символи = рівно 5 біт, тож стандартний base32 переводиться в ALPHABET простою заміною
+_B32_TO_ALPHABET = str.maketrans("ABCDEFGHIJKLMNOPQRSTUVWXYZ234567", ALPHABET)
 
 
 def random_seed(length=32):
     """Генерує випадковий плазмовий seed."""
-    return "".join(random.choice(ALPHABET) for _ in range(length))
+    raw = secrets.token_bytes((length * 5 + 7) // 8)
+    return base64.b32encode(raw).decode().rstrip("=").translate(_B32_TO_ALPHABET)[:length]
 
 
 def derive_checksum(seed):
     """Створює короткий контрольний хеш для seed."""
-    return hashlib.sha256(seed.encode()).hexdigest()[:10]
+    # BLAKE2b з digest_size=5 дає ті самі 10 hex-символів без обрізання SHA-256
+    return hashlib.blake2b(seed.encode(), digest_size=5).hexdigest()
 
 
 def encode_plasma_key(seed, checksum):
@@ -34,29 +41,28 @@ def encode_plasma_key(seed, checksum):
 
 
 def write_key(path, content):
-    with open(path, "w") as f:
-        f.write(content)
+    Path(path).write_text(content)
 
 
-def write_metadata(path, seed, checksum):
+def write_metadata(path, seed, checksum, rand=random):
     meta = {
         "file": os.path.basename(path),
         "type": "plasma-seed-key",
-        "generated_at": datetime.utcnow().isoformat() + "Z",
-        "entropy_level": f"{random.uniform(0.8, 1.0):.3f}",
+        "generated_at": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
+        "entropy_level": f"{rand.uniform(0.8, 1.0):.3f}",
         "seed_length": len(seed),
         "checksum": checksum,
         "tags": ["plasma", "seed", "crypto", "asset"]
     }
-    with open(path + ".json", "w") as f:
-        json.dump(meta, f, indent=2)
+    Path(path + ".json").write_text(json.dumps(meta, indent=2))
 
 
 def main():
     out_dir = "plasma_keys"
     os.makedirs(out_dir, exist_ok=True)
+    rand = random.Random()
 
-    name = f"plasma_{random.randint(1000, 9999)}.psdkey"
+    name = f"plasma_{rand.randint(1000, 9999)}.psdkey"
     path = os.path.join(out_dir, name)
 
     print(f"⚡ Generating plasma seed key: {name}")
@@ -66,7 +72,7 @@ def main():
     content = encode_plasma_key(seed, checksum)
 
     write_key(path, content)
-    write_metadata(path, seed, checksum)
+    write_metadata(path, seed, checksum, rand)
 
     print("✅ Key generated:", path)
     print("📄 Metadata:", path + ".json")
@@ -1,60 +1,60 @@
 # file: quantum_drop_builder.py
-# No external dependencies required
+# Requires: pip install numpy
 # Usage: python quantum_drop_builder.py
 
 import os
 import json
-import random
-from datetime import datetime
+from datetime import datetime, timezone
 
-def random_hex():
-    return "#{:06x}".format(random.randint(0, 0xFFFFFF))
+import numpy as np
 
-def generate_svg(width=600, height=600, shapes=15):
-    svg = [
-        f'<svg width="{width}" height="{height}" xmlns="http://www.w3.org/2000/svg">',
-        '<rect width="100%" height="100%" fill="black"/>'
-    ]
-    for _ in range(shapes):
-        cx = random.randint(0, width)
-        cy = random.randint(0, height)
-        r = random.randint(20, 120)
-        color = random_hex()
-        opacity = round(random.uniform(0.2, 0.8), 2)
-        svg.append(
-            f'<circle cx="{cx}" cy="{cy}" r="{r}" fill="{color}" fill-opacity="{opacity}"/>'
-        )
-    svg.append("</svg>")
-    return "\n".join(svg)
+SVG_HEADER = (
+    '<svg width="%d" height="%d" xmlns="http://www.w3.org/2000/svg">\n'
+    '<rect width="100%%" height="100%%" fill="black"/>\n'
+)
+SVG_FOOTER = "</svg>\n"
+CIRCLE_TEMPLATE = '<circle cx="%d" cy="%d" r="%d" fill="#%06x" fill-opacity="%.2f"/>\n'
 
-def make_metadata(filename, width, height):
+def generate_svg(out, rng, width=600, height=600, shapes=15):
+    # рядки йдуть одразу у файлоподібний out — без списку на весь SVG і join-копії
+    out.write(SVG_HEADER % (width, height))
+    # усі випадкові значення тягнемо одним викликом на параметр, а не п'ятьма на кожне коло
+    cxs = rng.integers(0, width + 1, shapes).tolist()
+    cys = rng.integers(0, height + 1, shapes).tolist()
+    radii = rng.integers(20, 121, shapes).tolist()
+    colors = rng.integers(0, 1 << 24, shapes).tolist()
+    opacities = rng.uniform(0.2, 0.8, shapes).round(2).tolist()
+    out.writelines(CIRCLE_TEMPLATE % shape for shape in zip(cxs, cys, radii, colors, opacities))
+    out.write(SVG_FOOTER)
+
+def make_metadata(filename, width, height, rng):
     return {
         "asset": filename,
         "type": "quantum-svg",
         "dimensions": f"{width}x{height}",
-        "generated_at": datetime.utcnow().isoformat() + "Z",
+        "generated_at": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
         "description": "Procedurally generated quantum-style SVG asset.",
-        "entropy_seed": random.randint(100000, 999999),
+        "entropy_seed": int(rng.integers(100000, 1000000)),
         "tags": ["quantum", "svg", "asset", "random"]
     }
 
 def main():
     out_dir = "quantum_drop"
     os.makedirs(out_dir, exist_ok=True)
+    rng = np.random.default_rng()
 
-    name = f"quantum_{random.randint(1000, 9999)}"
+    name = f"quantum_{rng.integers(1000, 10000)}"
     svg_file = os.path.join(out_dir, f"{name}.svg")
     json_file = os.path.join(out_dir, f"{name}.json")
 
     print(f"⚛️ Generating {name} ...")
 
-    svg = generate_svg()
     with open(svg_file, "w") as f:
-        f.write(svg)
+        generate_svg(f, rng)
 
-    metadata = make_metadata(f"{name}.svg", 600, 600)
+    metadata = make_metadata(f"{name}.svg", 600, 600, rng)
     with open(json_file, "w") as f:
-        json.dump(metadata, f, indent=2)
+        f.write(json.dumps(metadata, indent=2))
 
     print(f"✅ Created SVG: {svg_file}")
     print(f"✅ Created Metadata: {json_file}")
@@ -7,32 +7,26 @@ import json
 import random
 import struct
 import hashlib
-from datetime import datetime
+from datetime import datetime, timezone
 
 def random_bytes(n=256):
-    return bytes(random.getrandbits(8) for _ in range(n))
+    # один виклик у системний CSPRNG замість Python-ітерації на кожен байт
+    return os.urandom(n)
 
 def encode_header(packet_id, size):
     # Простий двобайтний заголовок: ID + розмір
     return struct.pack(">HI", packet_id, size)
 
-def compute_sha256(path):
-    h = hashlib.sha256()
-    with open(path, "rb") as f:
-        for chunk in iter(lambda: f.read(8192), b""):
-            h.update(chunk)
-    return h.hexdigest()
-
-def create_packet(out_path):
-    packet_id = random.randint(1000, 9999)
-    data = random_bytes(1024 + random.randint(0, 4096))
+def create_packet(out_path, rand=random):
+    packet_id = rand.randint(1000, 9999)
+    data = random_bytes(1024 + rand.randint(0, 4096))
     header = encode_header(packet_id, len(data))
     packet = header + data
 
     with open(out_path, "wb") as f:
         f.write(packet)
 
-    return packet_id, len(packet)
+    return packet_id, packet
 
 def write_metadata(path, packet_id, byte_size, sha):
     metadata = {
@@ -41,28 +35,30 @@ def write_metadata(path, packet_id, byte_size, sha):
         "bytes": byte_size,
         "sha256": sha,
         "type": "stellar-packet",
-        "generated_at": datetime.utcnow().isoformat() + "Z",
+        "generated_at": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
         "origin": "stellar_packet_forge.py",
         "info": "Random binary artifact for GitHub release assets."
     }
     meta_path = path + ".json"
     with open(meta_path, "w") as f:
-        json.dump(metadata, f, indent=2)
+        f.write(json.dumps(metadata, indent=2))
     return meta_path
 
 def main():
     out_dir = "stellar_output"
     os.makedirs(out_dir, exist_ok=True)
+    rand = random.Random()
 
-    name = f"packet_{random.randint(10000,99999)}.bin"
+    name = f"packet_{rand.randint(10000,99999)}.bin"
     packet_path = os.path.join(out_dir, name)
 
     print(f"🌌 Creating random stellar packet: {name}")
 
-    packet_id, size = create_packet(packet_path)
-    sha = compute_sha256(packet_path)
+    packet_id, packet = create_packet(packet_path, rand)
+    # пакет уже в пам'яті — хешуємо його, а не перечитуємо файл з диска
+    sha = hashlib.sha256(packet).hexdigest()
 
-    meta_path = write_metadata(packet_path, packet_id, size, sha)
+    meta_path = write_metadata(packet_path, packet_id, len(packet), sha)
 
     print(f"✅ Packet created: {packet_path}")
     print(f"📄 Metadata: {meta_path}")